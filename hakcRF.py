@@ -14,19 +14,56 @@ Features:
 - Backup capability
 """
 
+import certifi
 import requests
 import os
 import zipfile
 import shutil
+import ssl
 import sys
 import logging
+import mmap
 import argparse
+import asyncio
+import atexit
 import io
 import json
+import tempfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, BinaryIO, Iterable, Tuple, Union
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3Error
+from urllib3.util.retry import Retry
+
+from remote_zip import RemoteZip, RemoteZipEntry, RemoteZipError, decode_chunks, member_data
+
+try:
+    # Optional: ISA-L's SIMD inflate is a drop-in for zlib and speeds up
+    # every zipfile read in both extraction paths
+    from isal import isal_zlib as zlib
+    zipfile.zlib = zlib
+    zipfile.crc32 = zlib.crc32
+except ImportError:
+    import zlib
+
+try:
+    import liburing  # Optional: batched io_uring writes on Linux
+except ImportError:
+    liburing = None
+
+try:
+    import orjson  # Optional: faster JSON parsing and serialisation
+except ImportError:
+    orjson = None
+
+try:
+    import aiohttp  # Optional: event-loop based freqman downloads
+except ImportError:
+    aiohttp = None
 
 # ---------------------------------------------------------
 # CONFIGURATION
@@ -62,6 +99,49 @@ FREQ_COUNTRIES = [
     "Poland", "Romanian", "Slovakia", "Sweden", "USA", "WorldWide"
 ]
 
+# Firmware downloads are buffered in RAM up to this size before spilling to disk
+SPOOL_MAX_BYTES = 256 * 1024 * 1024
+
+# Read size for streamed downloads and minimum seconds between progress redraws
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+PROGRESS_INTERVAL = 0.1
+
+# Byte range fetched per request, and concurrent range requests, when the
+# firmware archive is extracted straight from the release server. Members
+# larger than one range are streamed rather than buffered.
+RANGE_SPAN_SIZE = 8 * 1024 * 1024
+RANGE_WORKERS = 8
+
+# Max file writes queued on the io_uring before each submit (Linux only), and
+# max inflated bytes held in buffers the kernel is still writing. Members
+# larger than COPY_BUFFER_SIZE bypass the ring and are streamed instead.
+URING_BATCH = 128
+URING_INFLIGHT_BYTES = 64 * 1024 * 1024
+
+# Buffer size used when copying extracted members to the SD card
+COPY_BUFFER_SIZE = 1 << 20
+
+# Threads used to unlink system files during clean install
+CLEAN_WORKERS = 16
+
+# Threads used to copy user folders during backup
+BACKUP_WORKERS = 8
+
+# Threads used to extract firmware members when io_uring is unavailable
+EXTRACT_WORKERS = os.cpu_count() or 4
+
+# Concurrent connections used for freqman file downloads
+FREQMAN_WORKERS = 16
+FREQMAN_ASYNC_LIMIT = 64
+
+# Keep-alive connections kept per host by the shared HTTP session
+HTTP_POOL_SIZE = 32
+
+# Retry policy for failed HTTP requests, shared by the session adapter and
+# the byte-range extraction loop (sleeps HTTP_BACKOFF * 2**attempt seconds)
+HTTP_RETRIES = 3
+HTTP_BACKOFF = 0.3
+
 # ---------------------------------------------------------
 # LOGGING SETUP
 # ---------------------------------------------------------
@@ -124,18 +204,70 @@ def format_size(size_bytes: int) -> str:
         size_bytes /= 1024
     return f"{size_bytes:.1f} TB"
 
+class DownloadProgress:
+    """Thread-safe download progress bar, redrawn at most every PROGRESS_INTERVAL"""
+    BAR_LEN = 40
+
+    def __init__(self, desc: str, total: int):
+        self.total = total
+        self.done = 0
+        self._last_draw = 0.0
+        self._lock = threading.Lock()
+        # Only the bar, percentage and current size change between redraws
+        self._line = f"\r{Colors.CYAN}{desc}: {{}} {{}}% ({{}}/{format_size(total)}){Colors.RESET}"
+
+    def update(self, nbytes: int):
+        with self._lock:
+            self.done += nbytes
+            now = time.monotonic()
+            if self.total > 0 and (now - self._last_draw >= PROGRESS_INTERVAL or self.done >= self.total):
+                self._last_draw = now
+                pct = int(100 * self.done / self.total)
+                filled = int(self.BAR_LEN * self.done / self.total)
+                bar = '█' * filled + '░' * (self.BAR_LEN - filled)
+                sys.stdout.write(self._line.format(bar, pct, format_size(self.done)))
+                sys.stdout.flush()
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON, using orjson when installed"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialise JSON with 2-space indent, using orjson when installed"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+# In-memory copy of STATE_FILE, written back once at exit when changed
+_state: Optional[Dict[str, Any]] = None
+_state_dirty = False
+
 def load_state() -> Dict[str, Any]:
-    """Load persistent state from disk"""
-    if STATE_FILE.exists():
-        try:
-            return json.loads(STATE_FILE.read_text())
-        except:
-            pass
-    return {}
+    """Load persistent state, reading the disk only on first use"""
+    global _state
+    if _state is None:
+        _state = {}
+        if STATE_FILE.exists():
+            try:
+                _state = json_loads(STATE_FILE.read_bytes())
+            except:
+                pass
+    return _state
 
 def save_state(state: Dict[str, Any]):
-    """Save persistent state to disk"""
-    STATE_FILE.write_text(json.dumps(state, indent=2))
+    """Merge state changes; they are written to disk once at exit"""
+    global _state_dirty
+    load_state().update(state)
+    _state_dirty = True
+
+def flush_state():
+    """Write persistent state to disk if it changed"""
+    global _state_dirty
+    if _state_dirty and _state is not None:
+        STATE_FILE.write_bytes(json_dumps(_state))
+        _state_dirty = False
+
+atexit.register(flush_state)
 
 # ---------------------------------------------------------
 # SD CARD OPERATIONS
@@ -156,21 +288,80 @@ def verify_disk_space() -> bool:
     print_status(f"Disk space OK: {available}MB available", "success")
     return True
 
+def list_card_folders() -> Dict[str, str]:
+    """Map upper-cased top-level folder names on the SD card to their paths
+
+    One directory listing replaces a stat per known folder name. Names are
+    upper-cased because FAT/exFAT lookups are case-insensitive.
+    """
+    with os.scandir(MOUNT_POINT) as it:
+        return {entry.name.upper(): entry.path for entry in it if entry.is_dir()}
+
+def _raise_error(error: OSError):
+    """os.walk error handler that propagates failures instead of skipping them"""
+    raise error
+
+def _fast_rmtree(path: str, executor: ThreadPoolExecutor):
+    """Remove a tree, unlinking files concurrently and directories serially
+
+    File unlinks are independent metadata updates the SD card can service in
+    parallel. os.walk(topdown=False) yields children before their parents,
+    so once every file is gone the directories are removed in walk order.
+    """
+    files = []
+    dirs = []
+    for root, dirnames, filenames in os.walk(path, topdown=False, onerror=_raise_error):
+        files.extend(os.path.join(root, name) for name in filenames)
+        # Symlinked directories are listed as dirs but must be unlinked
+        files.extend(os.path.join(root, name) for name in dirnames
+                     if os.path.islink(os.path.join(root, name)))
+        dirs.append(root)
+
+    list(executor.map(os.unlink, files))
+    for directory in dirs:
+        os.rmdir(directory)
+
 def clean_system_folders():
     """Remove old system files while preserving user data"""
     print_status(f"Cleaning system folders on {SD_CARD_NAME}...", "progress")
+    present = list_card_folders()
     cleaned = 0
-    for folder in SYSTEM_FOLDERS:
-        target_path = os.path.join(MOUNT_POINT, folder)
-        if os.path.exists(target_path):
-            try:
-                logging.info(f"Removing: {target_path}")
-                shutil.rmtree(target_path)
-                cleaned += 1
-            except OSError as e:
-                logging.error(f"Failed to clean {target_path}: {e}")
+    with ThreadPoolExecutor(max_workers=CLEAN_WORKERS) as executor:
+        for folder in SYSTEM_FOLDERS:
+            target_path = present.get(folder)
+            if target_path:
+                try:
+                    logging.info(f"Removing: {target_path}")
+                    _fast_rmtree(target_path, executor)
+                    cleaned += 1
+                except OSError as e:
+                    logging.error(f"Failed to clean {target_path}: {e}")
     print_status(f"Cleaned {cleaned} system folders", "success")
 
+def _parallel_copytree(src: str, dst: str, workers: int = BACKUP_WORKERS):
+    """Copy a directory tree with files copied concurrently
+
+    The tree is walked once up front and every destination directory is
+    created before any copy starts, so reads from the SD card and writes to
+    the backup disk overlap across worker threads.
+    """
+    files = []
+    pending = [(src, dst)]
+    while pending:
+        src_dir, dst_dir = pending.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    pending.append((entry.path, target))
+                else:
+                    files.append((entry.path, target))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(shutil.copy2, f, t) for f, t in files]:
+            future.result()
+
 def create_backup(backup_dir: Optional[str] = None) -> Optional[str]:
     """Create a backup of important files"""
     if not backup_dir:
@@ -183,22 +374,23 @@ def create_backup(backup_dir: Optional[str] = None) -> Optional[str]:
     print_status(f"Creating backup at: {backup_dir}", "progress")
     os.makedirs(backup_dir, exist_ok=True)
 
+    present = list_card_folders()
     backed_up = 0
     for folder in USER_FOLDERS:
-        src = os.path.join(MOUNT_POINT, folder)
-        if os.path.exists(src):
+        src = present.get(folder)
+        if src:
             dst = os.path.join(backup_dir, folder)
             try:
-                shutil.copytree(src, dst)
+                _parallel_copytree(src, dst)
                 backed_up += 1
                 logging.info(f"Backed up: {folder}")
             except Exception as e:
                 logging.warning(f"Could not backup {folder}: {e}")
 
     # Backup freqman files
-    freqman_src = os.path.join(MOUNT_POINT, "FREQMAN")
-    if os.path.exists(freqman_src):
-        shutil.copytree(freqman_src, os.path.join(backup_dir, "FREQMAN"), dirs_exist_ok=True)
+    freqman_src = present.get("FREQMAN")
+    if freqman_src:
+        _parallel_copytree(freqman_src, os.path.join(backup_dir, "FREQMAN"))
 
     print_status(f"Backed up {backed_up} user folders", "success")
     return backup_dir
@@ -206,33 +398,167 @@ def create_backup(backup_dir: Optional[str] = None) -> Optional[str]:
 # ---------------------------------------------------------
 # DOWNLOAD OPERATIONS
 # ---------------------------------------------------------
-def download_with_progress(url: str, dest_path: str, desc: str = "Downloading") -> bool:
-    """Download file with progress bar"""
+def create_session() -> requests.Session:
+    """Create an HTTP session with keep-alive connection pooling and retries"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(total=HTTP_RETRIES, backoff_factor=HTTP_BACKOFF)
+    )
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = 'hakcRF/1.0'
+    session.headers['Accept-Encoding'] = 'gzip'
+    # Authenticated requests avoid the 60/hour anonymous API rate limit
+    token = os.environ.get('GITHUB_TOKEN')
+    if token:
+        session.headers['Authorization'] = f"Bearer {token}"
+    return session
+
+# Shared by every GitHub request so TLS connections are reused
+SESSION = create_session()
+
+def download_with_progress(url: str, dest: BinaryIO, desc: str = "Downloading") -> bool:
+    """Download into an open binary file object with progress bar"""
     try:
-        with requests.get(url, stream=True, timeout=60) as r:
+        with SESSION.get(url, stream=True, timeout=60) as r:
             r.raise_for_status()
-            total_size = int(r.headers.get('content-length', 0))
-            downloaded = 0
-
-            with open(dest_path, 'wb') as f:
-                for chunk in r.iter_content(chunk_size=65536):
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total_size > 0:
-                        pct = int(100 * downloaded / total_size)
-                        bar_len = 40
-                        filled = int(bar_len * downloaded / total_size)
-                        bar = '█' * filled + '░' * (bar_len - filled)
-                        sys.stdout.write(f"\r{Colors.CYAN}{desc}: {bar} {pct}% ({format_size(downloaded)}/{format_size(total_size)}){Colors.RESET}")
-                        sys.stdout.flush()
+            progress = DownloadProgress(desc, int(r.headers.get('content-length', 0)))
+
+            # Large raw reads skip iter_content's per-chunk generator overhead
+            for chunk in iter(lambda: r.raw.read(DOWNLOAD_CHUNK_SIZE, decode_content=True), b''):
+                dest.write(chunk)
+                progress.update(len(chunk))
 
             print()  # newline after progress bar
             return True
 
-    except requests.RequestException as e:
+    except (requests.RequestException, Urllib3Error) as e:
         logging.error(f"Download failed: {e}")
         return False
 
+def _download_range(url: str, fd: int, start: int, end: int, progress: DownloadProgress):
+    """Fetch bytes start..end of url and pwrite them at the same file offset
+
+    A failed range is retried HTTP_RETRIES times with the session's backoff,
+    resuming from the last byte written.
+    """
+    offset = start
+    for attempt in range(HTTP_RETRIES + 1):
+        try:
+            headers = {'Range': f"bytes={offset}-{end}"}
+            with SESSION.get(url, headers=headers, stream=True, timeout=60) as r:
+                r.raise_for_status()
+                if r.status_code != 206:
+                    raise requests.RequestException("Server ignored the Range header")
+                for chunk in iter(lambda: r.raw.read(DOWNLOAD_CHUNK_SIZE), b''):
+                    view = memoryview(chunk)
+                    while view:
+                        written = os.pwrite(fd, view, offset)
+                        view = view[written:]
+                        offset += written
+                    progress.update(len(chunk))
+            if offset != end + 1:
+                raise requests.RequestException(f"Range {start}-{end} ended early at {offset}")
+            return
+        except (requests.RequestException, Urllib3Error) as e:
+            if attempt == HTTP_RETRIES:
+                raise
+            logging.warning(f"Range {offset}-{end} failed ({e}), retrying")
+            time.sleep(HTTP_BACKOFF * 2 ** attempt)
+
+def download_parallel(url: str, dest: BinaryIO, desc: str = "Downloading") -> Tuple[bool, bool]:
+    """Download as RANGE_WORKERS concurrent byte ranges, each written at its offset
+
+    Several connections aggregate more bandwidth than one. Falls back to a
+    single stream when the HEAD request fails, when the server does not
+    advertise range support, or when a range still fails after its retries.
+    The ranged path writes through dest.fileno(), so a SpooledTemporaryFile
+    rolls over to disk.
+
+    Returns (success, on_disk), where on_disk is True once dest.fileno() has
+    been written through.
+    """
+    try:
+        head = SESSION.head(url, allow_redirects=True, timeout=15)
+        head.raise_for_status()
+    except requests.RequestException as e:
+        # Some CDNs reject HEAD on signed URLs while a plain GET still works
+        logging.warning(f"HEAD request failed ({e}), downloading as a single stream")
+        return download_with_progress(url, dest, desc), False
+    size = int(head.headers.get('Content-Length', 0))
+    if head.headers.get('Accept-Ranges', '').lower() != 'bytes' or size < RANGE_SPAN_SIZE:
+        return download_with_progress(url, dest, desc), False
+
+    fd = dest.fileno()
+    _preallocate(fd, size)
+    progress = DownloadProgress(desc, size)
+    span = -(-size // RANGE_WORKERS)
+
+    with ThreadPoolExecutor(max_workers=RANGE_WORKERS) as executor:
+        futures = [
+            executor.submit(_download_range, url, fd, start, min(start + span, size) - 1, progress)
+            for start in range(0, size, span)
+        ]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except (requests.RequestException, Urllib3Error, OSError) as e:
+            executor.shutdown(cancel_futures=True)
+            print()
+            logging.warning(f"Ranged download failed ({e}), retrying as a single stream")
+            dest.seek(0)
+            dest.truncate()
+            return download_with_progress(url, dest, desc), True
+
+    print()  # newline after progress bar
+    dest.seek(size)
+    return True, True
+
+# Release and asset fields the updater reads; nothing else is cached
+RELEASE_FIELDS = ('tag_name', 'assets')
+ASSET_FIELDS = ('name', 'size', 'browser_download_url')
+
+def _trim_release(release: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop changelog bodies and other unused fields from a release"""
+    trimmed = {key: release[key] for key in RELEASE_FIELDS if key in release}
+    if 'assets' in trimmed:
+        trimmed['assets'] = [
+            {key: asset[key] for key in ASSET_FIELDS if key in asset}
+            for asset in trimmed['assets']
+        ]
+    return trimmed
+
+def fetch_release_json(url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    """GET a GitHub releases endpoint, revalidating the cached copy by ETag
+
+    A 304 Not Modified reply carries no body and does not count against the
+    API rate limit, so the JSON cached in STATE_FILE is reused instead. Only
+    RELEASE_FIELDS are kept, which keeps the 30-release nightly listing small.
+    """
+    state = load_state()
+    cache = state.get('release_cache', {})
+    cached = cache.get(url)
+    headers = {'If-None-Match': cached['etag']} if cached else {}
+
+    response = SESSION.get(url, timeout=15, params=params, headers=headers)
+    if response.status_code == 304 and cached:
+        logging.debug(f"Release info not modified, using cache: {url}")
+        return cached['data']
+    response.raise_for_status()
+
+    data = json_loads(response.content)
+    if isinstance(data, list):
+        data = [_trim_release(release) for release in data]
+    else:
+        data = _trim_release(data)
+    etag = response.headers.get('ETag')
+    if etag:
+        cache[url] = {'etag': etag, 'data': data}
+        state['release_cache'] = cache
+        save_state(state)
+    return data
+
 def fetch_github_release(nightly: bool = False) -> Optional[Dict[str, Any]]:
     """Fetch latest release info from GitHub
 
@@ -242,9 +568,7 @@ def fetch_github_release(nightly: bool = False) -> Optional[Dict[str, Any]]:
     try:
         if nightly:
             # Fetch all releases and find the latest nightly
-            response = requests.get(MAYHEM_ALL_RELEASES_API, timeout=15, params={'per_page': 30})
-            response.raise_for_status()
-            releases = response.json()
+            releases = fetch_release_json(MAYHEM_ALL_RELEASES_API, params={'per_page': 30})
 
             # Find the most recent nightly release
             for release in releases:
@@ -257,16 +581,330 @@ def fetch_github_release(nightly: bool = False) -> Optional[Dict[str, Any]]:
             # Fall through to stable release
 
         # Fetch latest stable release
-        response = requests.get(MAYHEM_RELEASES_API, timeout=15)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
+        return fetch_release_json(MAYHEM_RELEASES_API)
+    except (requests.RequestException, ValueError) as e:
+        # ValueError: a 200 reply whose body is not JSON (e.g. an HTML error page)
         logging.error(f"GitHub API error: {e}")
         return None
 
 # ---------------------------------------------------------
 # FIRMWARE INSTALLATION
 # ---------------------------------------------------------
+def print_extract_progress(done: int, total: int, force: bool = False):
+    """Redraw the extraction progress line every 50 files"""
+    if force or done % 50 == 0 or done == total:
+        pct = int(100 * done / total)
+        sys.stdout.write(f"\r{Colors.CYAN}Extracting: {pct}% ({done}/{total} files){Colors.RESET}")
+        sys.stdout.flush()
+
+def _preallocate(fd: int, size: int):
+    """Reserve a file's full size up front so FAT/exFAT extends its cluster chain once"""
+    if size <= 0:
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except (AttributeError, OSError):
+        # posix_fallocate is unavailable on macOS/Windows
+        os.ftruncate(fd, size)
+
+def _uring_reap(ring: Any, cqe: Any, inflight: Dict[int, Tuple[str, bytes]]) -> int:
+    """Wait for one write completion, finish any short write and close its file
+
+    Returns the size of the buffer released.
+    """
+    liburing.io_uring_wait_cqe(ring, cqe)
+    entry = cqe[0]
+    fd = entry.user_data
+    # A failed write completes with -errno (e.g. -ENOSPC on a full card);
+    # some liburing builds raise it on access instead of returning it
+    try:
+        written = entry.res
+    except OSError as e:
+        written = -e.errno
+    liburing.io_uring_cqe_seen(ring, entry)
+    path, data = inflight.pop(fd)
+    try:
+        if written < 0:
+            raise OSError(-written, os.strerror(-written), path)
+        while written < len(data):
+            written += os.pwrite(fd, memoryview(data)[written:], written)
+    finally:
+        os.close(fd)
+    return len(data)
+
+ArchiveEntry = Union[zipfile.ZipInfo, RemoteZipEntry]
+
+def _plan_extraction(entries: List[ArchiveEntry], dest: str) -> List[ArchiveEntry]:
+    """Filter and dedupe an archive's members in a single pass
+
+    Every directory, explicit or implied by a file path, is created here up
+    front so extraction workers never race on makedirs. Returns the file
+    members to extract; for duplicate names the last entry wins, matching
+    ZipFile.getinfo.
+    """
+    # Security: a member is only extracted if its normalised target lies
+    # inside the destination, which rejects absolute paths and any '..'
+    # traversal by construction (zip-slip)
+    root = os.path.join(os.path.realpath(dest), '')
+    files: Dict[str, ArchiveEntry] = {}
+    dirs = set()
+    for info in entries:
+        name = info.filename
+        if not os.path.normpath(os.path.join(root, name)).startswith(root):
+            logging.warning(f"Skipping suspicious path: {name}")
+            continue
+        if info.is_dir():
+            dirs.add(name)
+        else:
+            files[name] = info
+            dirs.add(os.path.dirname(name))
+
+    for directory in sorted(dirs):
+        os.makedirs(os.path.join(dest, directory), exist_ok=True)
+    return list(files.values())
+
+def _extract_uring(z: zipfile.ZipFile, members: List[zipfile.ZipInfo], dest: str):
+    """Extract file members with writes batched through io_uring
+
+    Each batch of URING_BATCH writes is submitted with a single syscall and
+    left in flight while the next batch is inflated, so SD card write
+    latency overlaps with decompression. Batches are also cut at
+    URING_INFLIGHT_BYTES so buffered data stays bounded.
+    """
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    liburing.io_uring_queue_init(URING_BATCH, ring)
+    inflight: Dict[int, Tuple[str, bytes]] = {}  # fd -> (path, buffer owned by the kernel)
+    inflight_bytes = 0
+    queued = 0
+    total = len(members)
+    try:
+        for i, info in enumerate(members):
+            if info.file_size > COPY_BUFFER_SIZE:
+                _extract_member(z, info, dest)
+                print_extract_progress(i + 1, total)
+                continue
+
+            data = z.read(info)
+            path = os.path.join(dest, info.filename)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            if data:
+                _preallocate(fd, len(data))
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_write(sqe, fd, data, 0)
+                liburing.io_uring_sqe_set_data64(sqe, fd)
+                inflight[fd] = (path, data)
+                inflight_bytes += len(data)
+                queued += 1
+            else:
+                os.close(fd)
+
+            if queued == URING_BATCH or inflight_bytes >= URING_INFLIGHT_BYTES:
+                liburing.io_uring_submit(ring)
+                queued = 0
+                # Keep at most one batch in flight behind the one just submitted
+                while len(inflight) > URING_BATCH or inflight_bytes > URING_INFLIGHT_BYTES // 2:
+                    inflight_bytes -= _uring_reap(ring, cqe, inflight)
+            print_extract_progress(i + 1, total)
+
+        liburing.io_uring_submit(ring)
+        while inflight:
+            _uring_reap(ring, cqe, inflight)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+        for fd in inflight:
+            os.close(fd)
+
+def _extract_member(z: zipfile.ZipFile, info: zipfile.ZipInfo, dest: str):
+    """Extract one file member through a large buffered write
+
+    No flush or fsync happens per file; install_everything issues a single
+    os.sync() once everything has been written.
+    """
+    fd = os.open(os.path.join(dest, info.filename), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    with os.fdopen(fd, 'wb', buffering=COPY_BUFFER_SIZE) as dst:
+        _preallocate(fd, info.file_size)
+        with z.open(info) as src:
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
+def _extract_parallel(z: zipfile.ZipFile, members: List[zipfile.ZipInfo], dest: str):
+    """Extract file members concurrently from one shared ZipFile
+
+    ZipFile serialises raw reads through its internal lock, so workers
+    overlap zlib inflation (which releases the GIL) with SD card writes.
+    """
+    total = len(members)
+    with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as executor:
+        futures = [executor.submit(_extract_member, z, info, dest) for info in members]
+        try:
+            for i, future in enumerate(as_completed(futures)):
+                future.result()
+                print_extract_progress(i + 1, total)
+        except Exception:
+            executor.shutdown(cancel_futures=True)
+            raise
+
+def _write_member(dest: str, entry: RemoteZipEntry, chunks: Iterable[bytes]):
+    """Write a member to the SD card as its decoded chunks arrive"""
+    fd = os.open(os.path.join(dest, entry.filename), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        _preallocate(fd, entry.file_size)
+        for chunk in chunks:
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _extract_span(remote: RemoteZip, start: int, end: int,
+                  members: List[RemoteZipEntry], dest: str) -> int:
+    """Fetch one byte range of the archive and extract the members inside it
+
+    A failed or truncated range is retried HTTP_RETRIES times with the
+    session's backoff; members already written are simply rewritten.
+    """
+    for attempt in range(HTTP_RETRIES + 1):
+        try:
+            # plan_spans gives an oversized member a span of its own
+            if len(members) == 1 and members[0].compress_size > RANGE_SPAN_SIZE:
+                _write_member(dest, members[0], remote.stream(members[0], DOWNLOAD_CHUNK_SIZE))
+                return 1
+            buf = remote.fetch_range(start, end)
+            for entry in members:
+                _write_member(dest, entry, decode_chunks(entry, [member_data(entry, buf, start)],
+                                                         COPY_BUFFER_SIZE))
+            return len(members)
+        except (requests.RequestException, Urllib3Error, RemoteZipError, zlib.error) as e:
+            if attempt == HTTP_RETRIES:
+                raise
+            logging.warning(f"Range {start}-{end} failed ({e}), retrying")
+            time.sleep(HTTP_BACKOFF * 2 ** attempt)
+    return 0
+
+def _extract_remote(remote: RemoteZip, members: List[RemoteZipEntry], dest: str):
+    """Extract members straight from the release server by byte range
+
+    Members are grouped into RANGE_SPAN_SIZE ranges fetched by RANGE_WORKERS
+    threads; each range is inflated and written as soon as it arrives, so
+    network transfer overlaps with decompression and SD card writes.
+    """
+    spans = remote.plan_spans(members, RANGE_SPAN_SIZE)
+    total = len(members)
+    done = 0
+    with ThreadPoolExecutor(max_workers=RANGE_WORKERS) as executor:
+        futures = [
+            executor.submit(_extract_span, remote, start, end, span_members, dest)
+            for start, end, span_members in spans
+        ]
+        try:
+            for future in as_completed(futures):
+                done += future.result()
+                print_extract_progress(done, total, force=True)
+        except Exception:
+            executor.shutdown(cancel_futures=True)
+            raise
+
+def _install_from_remote(remote: RemoteZip) -> bool:
+    """Extract the firmware archive by byte range without a full download
+
+    Returns False if extraction failed after the system folders were
+    cleaned; the caller then reinstalls from a full download.
+    """
+    # Clean old system files
+    clean_system_folders()
+
+    print_status("Downloading and extracting firmware to SD card...", "progress")
+    try:
+        members = _plan_extraction(remote.entries, MOUNT_POINT)
+        _extract_remote(remote, members, MOUNT_POINT)
+        print()
+        print_status("Firmware extraction complete", "success")
+    except (RemoteZipError, zlib.error) as e:
+        print_status(f"Downloaded data is corrupted: {e}", "error")
+        return False
+    except Exception as e:
+        print_status(f"Extraction failed: {e}", "error")
+        return False
+    return True
+
+class _ArchiveMap(mmap.mmap):
+    """Read-only mmap that zipfile accepts as a seekable file object"""
+    def seekable(self) -> bool:
+        return True
+
+class _SeekableSpool:
+    """Spooled archive that zipfile accepts as a seekable file object
+
+    SpooledTemporaryFile only gained seekable() in Python 3.11, and
+    ZipFile.open() needs it (macOS's system python3 is 3.9).
+    """
+    def __init__(self, spool: tempfile.SpooledTemporaryFile):
+        self._spool = spool
+
+    def seekable(self) -> bool:
+        return True
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._spool, name)
+
+def _map_archive(spool: tempfile.SpooledTemporaryFile, on_disk: bool) -> Union[_SeekableSpool, mmap.mmap]:
+    """Memory-map the downloaded archive for extraction if it is on disk
+
+    Extraction reads members at random offsets; through a mapping those reads
+    are served from the page cache instead of a seek + read syscall pair
+    each. An archive still held in RAM is only wrapped for zipfile.
+    """
+    if not on_disk:
+        return _SeekableSpool(spool)
+    fd = spool.fileno()
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    return _ArchiveMap(fd, 0, access=mmap.ACCESS_READ)
+
+def _install_from_download(download_url: str, name: str) -> bool:
+    """Download the whole firmware archive, then extract it"""
+    # Download into a spooled temp file rather than a staging directory.
+    # Ranged downloads pwrite into its underlying file, so those land on
+    # disk; single-stream downloads stay in RAM up to SPOOL_MAX_BYTES
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as spool:
+        ok, on_disk = download_parallel(download_url, spool, "Firmware")
+        if not ok:
+            return False
+
+        size = spool.tell()
+        logging.info(f"Download complete: {name} ({format_size(size)})")
+        spool.seek(0)
+        # A single stream spills to disk once it grows past max_size
+        on_disk = on_disk or size > SPOOL_MAX_BYTES
+
+        # Clean old system files
+        clean_system_folders()
+
+        # Extract to SD card
+        print_status("Extracting firmware to SD card...", "progress")
+        archive = spool
+        try:
+            archive = _map_archive(spool, on_disk)
+            with zipfile.ZipFile(archive, 'r') as z:
+                members = _plan_extraction(z.infolist(), MOUNT_POINT)
+                if liburing is not None and sys.platform.startswith('linux'):
+                    _extract_uring(z, members, MOUNT_POINT)
+                else:
+                    _extract_parallel(z, members, MOUNT_POINT)
+            print()
+            print_status("Firmware extraction complete", "success")
+
+        except zipfile.BadZipFile:
+            print_status("Downloaded file is corrupted", "error")
+            return False
+        except Exception as e:
+            print_status(f"Extraction failed: {e}", "error")
+            return False
+        finally:
+            if isinstance(archive, mmap.mmap):
+                archive.close()
+    return True
+
 def install_firmware(include_world_map: bool = True, nightly: bool = False):
     """Download and install the latest Mayhem firmware
 
@@ -303,55 +941,28 @@ def install_firmware(include_world_map: bool = True, nightly: bool = False):
         print_status("Could not find firmware asset", "error")
         return False
 
-    # Create staging directory
-    staging_dir = Path(__file__).parent / "staging_tmp"
-    staging_dir.mkdir(exist_ok=True)
-
-    zip_path = staging_dir / target_asset['name']
     download_url = target_asset['browser_download_url']
 
     print_status(f"Downloading: {target_asset['name']} ({format_size(target_asset['size'])})", "info")
 
-    if not download_with_progress(download_url, str(zip_path), "Firmware"):
-        return False
-
-    logging.info(f"Download complete: {zip_path}")
-
-    # Clean old system files
-    clean_system_folders()
-
-    # Extract to SD card
-    print_status("Extracting firmware to SD card...", "progress")
+    # Prefer range requests: extraction starts as soon as the central
+    # directory arrives instead of after the whole archive is downloaded
     try:
-        with zipfile.ZipFile(zip_path, 'r') as z:
-            members = z.namelist()
-            total = len(members)
-            for i, member in enumerate(members):
-                # Security: skip suspicious paths
-                if member.startswith("/") or ".." in member:
-                    logging.warning(f"Skipping suspicious path: {member}")
-                    continue
-                z.extract(member, MOUNT_POINT)
-                if (i + 1) % 50 == 0 or i == total - 1:
-                    pct = int(100 * (i + 1) / total)
-                    sys.stdout.write(f"\r{Colors.CYAN}Extracting: {pct}% ({i+1}/{total} files){Colors.RESET}")
-                    sys.stdout.flush()
-        print()
-        print_status("Firmware extraction complete", "success")
-
-    except zipfile.BadZipFile:
-        print_status("Downloaded file is corrupted", "error")
+        remote = RemoteZip(download_url, SESSION)
+    except (RemoteZipError, requests.RequestException) as e:
+        logging.info(f"Range requests unavailable ({e}), downloading whole archive")
+        remote = None
+
+    if remote is None:
+        installed = _install_from_download(download_url, target_asset['name'])
+    else:
+        installed = _install_from_remote(remote)
+        if not installed:
+            # The card has already been cleaned: never leave it half written
+            print_status("Retrying with a full download of the archive...", "warning")
+            installed = _install_from_download(download_url, target_asset['name'])
+    if not installed:
         return False
-    except Exception as e:
-        print_status(f"Extraction failed: {e}", "error")
-        return False
-    finally:
-        # Cleanup staging
-        try:
-            shutil.rmtree(staging_dir)
-            logging.info("Staging directory cleaned up")
-        except:
-            pass
 
     # Update state
     state = load_state()
@@ -368,10 +979,10 @@ def fetch_freqman_file_list(path: str = "") -> List[Dict[str, Any]]:
     """Fetch list of files from freqman repository"""
     url = f"{FREQMAN_API}/{path}" if path else FREQMAN_API
     try:
-        response = requests.get(url, timeout=15)
+        response = SESSION.get(url, timeout=15)
         response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
+        return json_loads(response.content)
+    except (requests.RequestException, ValueError) as e:
         logging.error(f"Failed to fetch freqman list: {e}")
         return []
 
@@ -382,7 +993,7 @@ def download_freqman_file(path: str, dest_dir: str) -> bool:
     dest_path = os.path.join(dest_dir, filename)
 
     try:
-        response = requests.get(url, timeout=30)
+        response = SESSION.get(url, timeout=30)
         response.raise_for_status()
         with open(dest_path, 'wb') as f:
             f.write(response.content)
@@ -391,6 +1002,49 @@ def download_freqman_file(path: str, dest_dir: str) -> bool:
         logging.warning(f"Failed to download {path}: {e}")
         return False
 
+async def _download_freqman_async(paths: List[str], dest_dir: str) -> Tuple[int, int]:
+    """Download freqman files concurrently on a single event loop
+
+    Returns (installed, failed). File writes are handed to a worker thread so
+    a slow SD card never stalls the sockets.
+    """
+    # Trust the same certifi bundle as requests rather than the system store,
+    # which python.org macOS builds leave empty until "Install Certificates"
+    ssl_context = ssl.create_default_context(cafile=certifi.where())
+    connector = aiohttp.TCPConnector(limit=FREQMAN_ASYNC_LIMIT, ttl_dns_cache=300, ssl=ssl_context)
+    # Per-socket limits only: a total deadline would also count the time a
+    # request spends queued for one of the connector's slots
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30)
+    headers = {'User-Agent': SESSION.headers['User-Agent']}
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+        async def fetch(path: str) -> bytes:
+            # Same policy as the session's Retry adapter: connection and read
+            # errors are retried with backoff, HTTP error statuses are not
+            for attempt in range(HTTP_RETRIES + 1):
+                try:
+                    async with session.get(f"{FREQMAN_RAW_BASE}/{path}") as response:
+                        response.raise_for_status()
+                        return await response.read()
+                except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError):
+                    if attempt == HTTP_RETRIES:
+                        raise
+                    await asyncio.sleep(HTTP_BACKOFF * 2 ** attempt)
+
+        async def download(path: str) -> bool:
+            try:
+                data = await fetch(path)
+                await asyncio.to_thread(Path(dest_dir, os.path.basename(path)).write_bytes, data)
+                return True
+            except Exception as e:
+                logging.warning(f"Failed to download {path}: {e}")
+                return False
+
+        results = await asyncio.gather(*(download(path) for path in paths))
+
+    installed = sum(results)
+    return installed, len(results) - installed
+
 def install_frequency_databases(countries: Optional[List[str]] = None):
     """Download and install frequency databases"""
     print_status("Installing frequency databases...", "progress")
@@ -398,29 +1052,41 @@ def install_frequency_databases(countries: Optional[List[str]] = None):
     freqman_dir = os.path.join(MOUNT_POINT, "FREQMAN")
     os.makedirs(freqman_dir, exist_ok=True)
 
-    installed = 0
-    failed = 0
-
-    # Install generic files
-    print_status("Fetching generic frequency files...", "info")
-    generic_files = fetch_freqman_file_list("generic")
-    for item in generic_files:
-        if item.get('type') == 'file' and item['name'].endswith(('.txt', '.TXT')):
-            if download_freqman_file(f"generic/{item['name']}", freqman_dir):
-                installed += 1
-            else:
-                failed += 1
-
-    # Install country-specific files
     target_countries = countries if countries else FREQ_COUNTRIES
-
-    for country in target_countries:
-        print_status(f"Fetching {country} frequency files...", "info")
-        country_files = fetch_freqman_file_list(f"country-specific/{country}")
-
-        for item in country_files:
-            if item.get('type') == 'file':
-                if download_freqman_file(f"country-specific/{country}/{item['name']}", freqman_dir):
+    listing_paths = ["generic"] + [f"country-specific/{c}" for c in target_countries]
+
+    # Fetch all directory listings concurrently
+    print_status(f"Fetching frequency file lists (generic + {len(target_countries)} countries)...", "info")
+    with ThreadPoolExecutor(max_workers=len(listing_paths)) as executor:
+        listings = dict(zip(listing_paths, executor.map(fetch_freqman_file_list, listing_paths)))
+
+    # Keyed by filename so later entries win (as with the old serial
+    # loop) and no two workers write the same file
+    remote_paths: Dict[str, str] = {}
+    for listing_path, items in listings.items():
+        for item in items:
+            if item.get('type') != 'file':
+                continue
+            if listing_path == "generic" and not item['name'].endswith(('.txt', '.TXT')):
+                continue
+            remote_paths[item['name']] = f"{listing_path}/{item['name']}"
+
+    # Download everything concurrently: on one event loop when aiohttp is
+    # installed, otherwise through a thread pool over the shared session
+    print_status(f"Downloading {len(remote_paths)} frequency files...", "progress")
+    if aiohttp is not None:
+        installed, failed = asyncio.run(
+            _download_freqman_async(list(remote_paths.values()), freqman_dir))
+    else:
+        installed = 0
+        failed = 0
+        with ThreadPoolExecutor(max_workers=FREQMAN_WORKERS) as executor:
+            futures = [
+                executor.submit(download_freqman_file, path, freqman_dir)
+                for path in remote_paths.values()
+            ]
+            for future in as_completed(futures):
+                if future.result():
                     installed += 1
                 else:
                     failed += 1
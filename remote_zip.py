@@ -0,0 +1,292 @@
+"""
+Remote ZIP Access over HTTP Range Requests
+==========================================
+Reads a ZIP archive's central directory from the tail of a remote file and
+fetches individual members by byte range, so a subset of a large archive can
+be pulled without downloading all of it.
+
+Only stored and deflated members are supported, which covers everything the
+Mayhem release packages ship.
+"""
+
+import struct
+from typing import Any, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import requests
+
+try:
+    from isal import isal_zlib as zlib  # Optional: SIMD-accelerated inflate
+except ImportError:
+    import zlib
+
+# ---------------------------------------------------------
+# ZIP FORMAT CONSTANTS
+# ---------------------------------------------------------
+EOCD_SIG = b"PK\x05\x06"
+ZIP64_LOCATOR_SIG = b"PK\x06\x07"
+ZIP64_EOCD_SIG = b"PK\x06\x06"
+CENTRAL_DIR_SIG = b"PK\x01\x02"
+LOCAL_HEADER_SIG = b"PK\x03\x04"
+
+EOCD_STRUCT = struct.Struct("<4s4H2LH")
+ZIP64_LOCATOR_STRUCT = struct.Struct("<4sLQL")
+ZIP64_EOCD_STRUCT = struct.Struct("<4sQ2H2L4Q")
+CENTRAL_DIR_STRUCT = struct.Struct("<4s4B4HL2L5H2L")
+LOCAL_HEADER_STRUCT = struct.Struct("<4s5H3L2H")
+
+ZIP64_EXTRA_ID = 0x0001
+ENCRYPTED_FLAG = 0x1
+UTF8_FLAG = 0x800
+
+STORED = 0
+DEFLATED = 8
+
+# Bytes fetched from the end of the archive: EOCD (22) + max comment (65535)
+# + ZIP64 locator (20), rounded up. Small central directories arrive in the
+# same request.
+TAIL_SIZE = 1 << 17
+
+# Members separated by at most this many bytes (e.g. skipped directory
+# entries) are still merged into one span
+SPAN_GAP = 65536
+
+
+class RemoteZipError(Exception):
+    """Raised when a remote archive cannot be read by range requests"""
+
+
+class RemoteZipEntry(NamedTuple):
+    """One member as listed in the central directory"""
+    filename: str
+    header_offset: int
+    compress_size: int
+    file_size: int
+    compress_type: int
+    crc: int
+
+    def is_dir(self) -> bool:
+        return self.filename.endswith('/')
+
+
+def _data_offset(entry: RemoteZipEntry, header: bytes) -> int:
+    """Return the length of a member's local header, name and extra field"""
+    if len(header) < LOCAL_HEADER_STRUCT.size:
+        raise RemoteZipError(f"Truncated local header: {entry.filename}")
+    fields = LOCAL_HEADER_STRUCT.unpack(header[:LOCAL_HEADER_STRUCT.size])
+    if fields[0] != LOCAL_HEADER_SIG:
+        raise RemoteZipError(f"Bad local header signature: {entry.filename}")
+    return LOCAL_HEADER_STRUCT.size + fields[9] + fields[10]
+
+
+def member_data(entry: RemoteZipEntry, buf: bytes, buf_offset: int = 0) -> memoryview:
+    """Locate one member's raw (still compressed) data in a fetched buffer
+
+    Args:
+        entry: Central directory entry for the member
+        buf: Bytes of the archive starting at archive offset buf_offset
+        buf_offset: Archive offset of buf[0]
+    """
+    buf = memoryview(buf)
+    start = entry.header_offset - buf_offset
+    data_start = start + _data_offset(entry, buf[start:start + LOCAL_HEADER_STRUCT.size])
+    raw = buf[data_start:data_start + entry.compress_size]
+    if len(raw) < entry.compress_size:
+        raise RemoteZipError(f"Truncated member data: {entry.filename}")
+    return raw
+
+
+def decode_chunks(entry: RemoteZipEntry, chunks: Iterable[bytes],
+                  max_chunk: int = 1 << 20) -> Iterator[bytes]:
+    """Decode a member's raw data incrementally
+
+    Yields decoded chunks of at most max_chunk bytes (stored chunks pass
+    through without a copy) and checks size and CRC once the data ends.
+    """
+    if entry.compress_type not in (STORED, DEFLATED):
+        raise RemoteZipError(f"Unsupported compression {entry.compress_type}: {entry.filename}")
+    inflater = zlib.decompressobj(-15) if entry.compress_type == DEFLATED else None
+    crc = 0
+    size = 0
+    for chunk in chunks:
+        while chunk:
+            if inflater is None:
+                data, chunk = chunk, b""
+            else:
+                data = inflater.decompress(chunk, max_chunk)
+                chunk = inflater.unconsumed_tail
+            crc = zlib.crc32(data, crc)
+            size += len(data)
+            yield data
+    if inflater is not None:
+        data = inflater.flush()
+        crc = zlib.crc32(data, crc)
+        size += len(data)
+        yield data
+    if size != entry.file_size or crc != entry.crc:
+        raise RemoteZipError(f"CRC mismatch: {entry.filename}")
+
+
+class RemoteZip:
+    """A ZIP archive served over HTTP, read via Range requests
+
+    Args:
+        url: Archive URL; the server must honour byte ranges
+        session: Optional requests.Session for connection reuse
+    """
+
+    def __init__(self, url: str, session: Optional[requests.Session] = None):
+        self.url = url
+        self._http: Any = session or requests
+        self.size = self._fetch_size()
+        self.cd_offset = 0
+        self.entries = self._read_central_directory()
+
+    def fetch_range(self, start: int, end: int) -> bytes:
+        """Fetch archive bytes start..end inclusive"""
+        headers = {'Range': f"bytes={start}-{end}"}
+        with self._http.get(self.url, headers=headers, stream=True, timeout=60) as r:
+            r.raise_for_status()
+            if r.status_code != 206:
+                raise RemoteZipError("Server ignored the Range header")
+            return r.content
+
+    def iter_range(self, start: int, end: int, chunk_size: int) -> Iterator[bytes]:
+        """Stream archive bytes start..end inclusive in chunks of chunk_size"""
+        headers = {'Range': f"bytes={start}-{end}"}
+        received = 0
+        with self._http.get(self.url, headers=headers, stream=True, timeout=60) as r:
+            r.raise_for_status()
+            if r.status_code != 206:
+                raise RemoteZipError("Server ignored the Range header")
+            for chunk in r.iter_content(chunk_size):
+                received += len(chunk)
+                yield chunk
+        if received != end - start + 1:
+            raise RemoteZipError(f"Range {start}-{end} ended early")
+
+    def stream(self, entry: RemoteZipEntry, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+        """Fetch and decode one member chunk by chunk, without buffering it whole"""
+        header = self.fetch_range(entry.header_offset,
+                                  entry.header_offset + LOCAL_HEADER_STRUCT.size - 1)
+        data_start = entry.header_offset + _data_offset(entry, header)
+        if entry.compress_size == 0:
+            return decode_chunks(entry, [], chunk_size)
+        raw = self.iter_range(data_start, data_start + entry.compress_size - 1, chunk_size)
+        return decode_chunks(entry, raw, chunk_size)
+
+    def plan_spans(self, entries: List[RemoteZipEntry],
+                   max_span: int) -> List[Tuple[int, int, List[RemoteZipEntry]]]:
+        """Group members into byte ranges of roughly max_span bytes each
+
+        A member's extent runs up to the next local header (or the central
+        directory), so every span covers complete headers, data and any data
+        descriptors. Returns (start, end_inclusive, members) tuples ordered by
+        archive offset.
+        """
+        bounds = sorted({e.header_offset for e in self.entries} | {self.cd_offset})
+        next_offset = dict(zip(bounds, bounds[1:]))
+
+        spans: List[Tuple[int, int, List[RemoteZipEntry]]] = []
+        for entry in sorted(entries, key=lambda e: e.header_offset):
+            end = next_offset[entry.header_offset] - 1
+            if spans:
+                start, last_end, members = spans[-1]
+                if entry.header_offset - last_end <= SPAN_GAP and end - start < max_span:
+                    members.append(entry)
+                    spans[-1] = (start, end, members)
+                    continue
+            spans.append((entry.header_offset, end, [entry]))
+        return spans
+
+    def _fetch_size(self) -> int:
+        response = self._http.head(self.url, allow_redirects=True, timeout=15)
+        response.raise_for_status()
+        if response.headers.get('Accept-Ranges', '').lower() == 'none':
+            raise RemoteZipError("Server does not support range requests")
+        size = int(response.headers.get('Content-Length', 0))
+        if size <= 0:
+            raise RemoteZipError("Server did not report the archive size")
+        # self.url is kept as given: release asset redirects point at signed
+        # URLs that expire within minutes, so each range request re-resolves
+        return size
+
+    def _read_central_directory(self) -> List[RemoteZipEntry]:
+        # A truncated or corrupt directory surfaces as struct, iterator or
+        # decode errors deep in the parse; report them all as RemoteZipError
+        # so callers can fall back to a full download
+        try:
+            return self._parse_central_directory()
+        except (struct.error, StopIteration, UnicodeDecodeError) as e:
+            raise RemoteZipError(f"Malformed central directory: {e}") from e
+
+    def _parse_central_directory(self) -> List[RemoteZipEntry]:
+        tail_start = max(0, self.size - TAIL_SIZE)
+        tail = self.fetch_range(tail_start, self.size - 1)
+
+        eocd_pos = tail.rfind(EOCD_SIG)
+        if eocd_pos < 0 or eocd_pos + EOCD_STRUCT.size > len(tail):
+            raise RemoteZipError("End of central directory not found")
+        eocd = EOCD_STRUCT.unpack(tail[eocd_pos:eocd_pos + EOCD_STRUCT.size])
+        count, cd_size, cd_offset = eocd[4], eocd[5], eocd[6]
+
+        # ZIP64: the real values live in the ZIP64 EOCD record
+        locator_pos = eocd_pos - ZIP64_LOCATOR_STRUCT.size
+        if locator_pos >= 0 and tail[locator_pos:locator_pos + 4] == ZIP64_LOCATOR_SIG:
+            zip64_offset = ZIP64_LOCATOR_STRUCT.unpack(
+                tail[locator_pos:locator_pos + ZIP64_LOCATOR_STRUCT.size])[2]
+            record = self._slice(tail, tail_start, zip64_offset, ZIP64_EOCD_STRUCT.size)
+            fields = ZIP64_EOCD_STRUCT.unpack(record)
+            if fields[0] != ZIP64_EOCD_SIG:
+                raise RemoteZipError("Bad ZIP64 end of central directory")
+            count, cd_size, cd_offset = fields[7], fields[8], fields[9]
+
+        self.cd_offset = cd_offset
+        cd = self._slice(tail, tail_start, cd_offset, cd_size)
+        entries = []
+        pos = 0
+        for _ in range(count):
+            fields = CENTRAL_DIR_STRUCT.unpack(cd[pos:pos + CENTRAL_DIR_STRUCT.size])
+            if fields[0] != CENTRAL_DIR_SIG:
+                raise RemoteZipError("Bad central directory entry")
+            flags, method, crc = fields[5], fields[6], fields[9]
+            compress_size, file_size = fields[10], fields[11]
+            name_len, extra_len, comment_len = fields[12], fields[13], fields[14]
+            header_offset = fields[18]
+
+            pos += CENTRAL_DIR_STRUCT.size
+            raw_name = cd[pos:pos + name_len]
+            extra = cd[pos + name_len:pos + name_len + extra_len]
+            pos += name_len + extra_len + comment_len
+
+            file_size, compress_size, header_offset = self._apply_zip64_extra(
+                extra, file_size, compress_size, header_offset)
+            filename = raw_name.decode('utf-8' if flags & UTF8_FLAG else 'cp437')
+            if method not in (STORED, DEFLATED) or flags & ENCRYPTED_FLAG:
+                raise RemoteZipError(f"Unsupported member encoding: {filename}")
+            entries.append(RemoteZipEntry(
+                filename, header_offset, compress_size, file_size, method, crc))
+        return entries
+
+    def _slice(self, tail: bytes, tail_start: int, offset: int, length: int) -> bytes:
+        """Return archive bytes from the fetched tail, fetching if not covered"""
+        if offset >= tail_start:
+            start = offset - tail_start
+            return tail[start:start + length]
+        return self.fetch_range(offset, offset + length - 1)
+
+    @staticmethod
+    def _apply_zip64_extra(extra: bytes, file_size: int, compress_size: int, header_offset: int):
+        pos = 0
+        while pos + 4 <= len(extra):
+            tag, size = struct.unpack("<2H", extra[pos:pos + 4])
+            if tag == ZIP64_EXTRA_ID:
+                values = iter(struct.unpack(f"<{size // 8}Q", extra[pos + 4:pos + 4 + size - size % 8]))
+                if file_size == 0xFFFFFFFF:
+                    file_size = next(values)
+                if compress_size == 0xFFFFFFFF:
+                    compress_size = next(values)
+                if header_offset == 0xFFFFFFFF:
+                    header_offset = next(values)
+                break
+            pos += 4 + size
+        return file_size, compress_size, header_offset